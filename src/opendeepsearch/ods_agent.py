@@ -10,6 +10,9 @@ import asyncio
 import nest_asyncio
 load_dotenv()
 
+# Response sections read by SourceProcessor and build_context
+_CONTEXT_SECTIONS = frozenset({'organic', 'topStories', 'answerBox'})
+
 class OpenDeepSearchAgent:
     def __init__(
         self,
@@ -104,7 +107,7 @@ class OpenDeepSearchAgent:
             str: A formatted context string built from the processed search results.
         """
         # Get sources from SERP
-        sources = self.serp_search.get_sources(query)
+        sources = await self.serp_search.aget_sources(query, sections=_CONTEXT_SECTIONS)
 
         # Process sources
         processed_sources = await self.source_processor.process_sources(
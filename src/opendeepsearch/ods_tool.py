@@ -1,7 +1,27 @@
+from functools import lru_cache
 from typing import Optional, Literal
 from smolagents import Tool
 from opendeepsearch.ods_agent import OpenDeepSearchAgent
 
+@lru_cache(maxsize=8)
+def _get_agent(
+    model_name: Optional[str],
+    reranker: str,
+    search_provider: str,
+    serper_api_key: Optional[str],
+    searxng_instance_url: Optional[str],
+    searxng_api_key: Optional[str]
+) -> OpenDeepSearchAgent:
+    """Build an agent once per configuration so rerankers and clients are shared across tools"""
+    return OpenDeepSearchAgent(
+        model_name,
+        reranker=reranker,
+        search_provider=search_provider,
+        serper_api_key=serper_api_key,
+        searxng_instance_url=searxng_instance_url,
+        searxng_api_key=searxng_api_key
+    )
+
 class OpenDeepSearchTool(Tool):
     name = "web_search"
     description = """
@@ -36,11 +56,11 @@ class OpenDeepSearchTool(Tool):
         return answer
 
     def setup(self):
-        self.search_tool = OpenDeepSearchAgent(
+        self.search_tool = _get_agent(
             self.search_model_name,
-            reranker=self.reranker,
-            search_provider=self.search_provider,
-            serper_api_key=self.serper_api_key,
-            searxng_instance_url=self.searxng_instance_url,
-            searxng_api_key=self.searxng_api_key
+            self.reranker,
+            self.search_provider,
+            self.serper_api_key,
+            self.searxng_instance_url,
+            self.searxng_api_key
         )
@@ -1,12 +1,59 @@
 import os
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List, TypeVar, Generic, Union
+from itertools import islice
+from typing import AbstractSet, Dict, Any, Iterable, Mapping, Optional, List, Sequence, TypeVar, Generic, Union
 from abc import ABC, abstractmethod
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional; fall back to a full orjson parse
+    simdjson = None
 
 T = TypeVar('T')
 
+# Shared session so TCP/TLS connections are reused across queries
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=100))
+
+# Sections of a standardized search response
+ALL_SECTIONS = frozenset({
+    'organic', 'topStories', 'images', 'graph', 'answerBox', 'peopleAlsoAsk', 'relatedSearches'
+})
+
+# Sections SearXNG has no direct equivalent for, returned as None
+_SEARXNG_NULL_SECTIONS = ('graph', 'answerBox', 'peopleAlsoAsk')
+
+# Fields kept from each Serper result section
+_ORGANIC_FIELDS = ('title', 'link', 'snippet', 'date')
+_MEDIA_FIELDS = ('title', 'imageUrl')
+
+# Serper sections passed through as-is, keyed by their standardized name
+_SERPER_PASSTHROUGH = (
+    ('graph', 'knowledgeGraph'),
+    ('answerBox', 'answerBox'),
+    ('peopleAlsoAsk', 'peopleAlsoAsk'),
+    ('relatedSearches', 'relatedSearches')
+)
+
+def _parse_json(content: bytes) -> Any:
+    """Parse a response body, lazily with simdjson when it is installed"""
+    if simdjson is not None:
+        return simdjson.Parser().parse(content)
+    return orjson.loads(content)
+
+def _detach(value: Any) -> Any:
+    """Convert a lazy simdjson container into plain Python objects"""
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if hasattr(value, 'as_list'):
+        return value.as_list()
+    return value
+
 class SearchAPIException(Exception):
     """Custom exception for Search API related errors"""
     pass
@@ -19,7 +66,7 @@ class SearXNGException(SearchAPIException):
     """Custom exception for SearXNG related errors"""
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SerperConfig:
     """Configuration for Serper API"""
     api_key: str
@@ -35,7 +82,7 @@ class SerperConfig:
             raise SerperAPIException("SERPER_API_KEY environment variable not set")
         return cls(api_key=api_key)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearXNGConfig:
     """Configuration for SearXNG instance"""
     instance_url: str
@@ -54,28 +101,42 @@ class SearXNGConfig:
 
 class SearchResult(Generic[T]):
     """Container for search results with error handling"""
+    __slots__ = ('data', 'error', 'success', 'failed')
+
     def __init__(self, data: Optional[T] = None, error: Optional[str] = None):
         self.data = data
         self.error = error
         self.success = error is None
-
-    @property
-    def failed(self) -> bool:
-        return not self.success
+        self.failed = not self.success
 
 class SearchAPI(ABC):
     """Abstract base class for search APIs"""
+    __slots__ = ()
+
     @abstractmethod
     def get_sources(
         self,
         query: str,
         num_results: int = 8,
-        stored_location: Optional[str] = None
+        stored_location: Optional[str] = None,
+        sections: AbstractSet[str] = ALL_SECTIONS
     ) -> SearchResult[Dict[str, Any]]:
         """Get search results from the API"""
         pass
 
+    async def aget_sources(
+        self,
+        query: str,
+        num_results: int = 8,
+        stored_location: Optional[str] = None,
+        sections: AbstractSet[str] = ALL_SECTIONS
+    ) -> SearchResult[Dict[str, Any]]:
+        """Get search results without blocking the event loop, reusing the shared pooled session"""
+        return await asyncio.to_thread(self.get_sources, query, num_results, stored_location, sections)
+
 class SerperAPI(SearchAPI):
+    __slots__ = ('config', 'headers')
+
     def __init__(self, api_key: Optional[str] = None, config: Optional[SerperConfig] = None):
         if api_key:
             self.config = SerperConfig(api_key=api_key)
@@ -88,15 +149,20 @@ class SerperAPI(SearchAPI):
         }
 
     @staticmethod
-    def extract_fields(items: List[Dict[str, Any]], fields: List[str]) -> List[Dict[str, Any]]:
-        """Extract specified fields from a list of dictionaries"""
-        return [{key: item.get(key, "") for key in fields if key in item} for item in items]
+    def extract_fields(
+        items: Iterable[Mapping[str, Any]],
+        fields: Sequence[str],
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract specified fields from an iterable of mappings, stopping after `limit` items"""
+        return [{key: item[key] for key in fields if key in item} for item in islice(items, limit)]
 
     def get_sources(
         self,
         query: str,
         num_results: int = 8,
-        stored_location: Optional[str] = None
+        stored_location: Optional[str] = None,
+        sections: AbstractSet[str] = ALL_SECTIONS
     ) -> SearchResult[Dict[str, Any]]:
         """
         Fetch search results from Serper API.
@@ -105,6 +171,7 @@ class SerperAPI(SearchAPI):
             query: Search query string
             num_results: Number of results to return (default: 8, max: 10)
             stored_location: Optional location string
+            sections: Response sections to build (default: all)
 
         Returns:
             SearchResult containing the search results or error information
@@ -113,52 +180,59 @@ class SerperAPI(SearchAPI):
             return SearchResult(error="Query cannot be empty")
 
         try:
-            search_location = (stored_location or self.config.default_location).lower()
-
-            payload = {
-                "q": query,
-                "num": min(max(1, num_results), 10),
-                "gl": search_location
-            }
-
-            response = requests.post(
+            response = _SESSION.post(
                 self.config.api_url,
                 headers=self.headers,
-                json=payload,
+                data=orjson.dumps(self._build_payload(query, num_results, stored_location)),
                 timeout=self.config.timeout
             )
-            response.raise_for_status()
-            data = response.json()
-
-            results = {
-                'organic': self.extract_fields(
-                    data.get('organic', []),
-                    ['title', 'link', 'snippet', 'date']
-                ),
-                'topStories': self.extract_fields(
-                    data.get('topStories', []),
-                    ['title', 'imageUrl']
-                ),
-                'images': self.extract_fields(
-                    data.get('images', [])[:6],
-                    ['title', 'imageUrl']
-                ),
-                'graph': data.get('knowledgeGraph'),
-                'answerBox': data.get('answerBox'),
-                'peopleAlsoAsk': data.get('peopleAlsoAsk'),
-                'relatedSearches': data.get('relatedSearches')
-            }
-
-            return SearchResult(data=results)
+            if response.status_code != 200:
+                return SearchResult(error=f"API request failed: HTTP {response.status_code}")
+            data = _parse_json(response.content)
+
+            return SearchResult(data=self._format_results(data, sections))
 
         except requests.RequestException as e:
             return SearchResult(error=f"API request failed: {str(e)}")
         except Exception as e:
             return SearchResult(error=f"Unexpected error: {str(e)}")
 
+    def _build_payload(self, query: str, num_results: int, stored_location: Optional[str]) -> Dict[str, Any]:
+        """Build the Serper request payload"""
+        return {
+            "q": query,
+            "num": min(max(1, num_results), 10),
+            "gl": (stored_location or self.config.default_location).lower()
+        }
+
+    def _format_results(self, data: Any, sections: AbstractSet[str]) -> Dict[str, Any]:
+        """Keep only the requested sections and the fields used downstream"""
+        results = {}
+        if 'organic' in sections:
+            results['organic'] = self.extract_fields(
+                data.get('organic') or (),
+                _ORGANIC_FIELDS
+            )
+        if 'topStories' in sections:
+            results['topStories'] = self.extract_fields(
+                data.get('topStories') or (),
+                _MEDIA_FIELDS
+            )
+        if 'images' in sections:
+            results['images'] = self.extract_fields(
+                data.get('images') or (),
+                _MEDIA_FIELDS,
+                limit=6
+            )
+        for section, key in _SERPER_PASSTHROUGH:
+            if section in sections:
+                results[section] = _detach(data.get(key))
+        return results
+
 
 class SearXNGAPI(SearchAPI):
     """API client for SearXNG search engine"""
+    __slots__ = ('config', 'headers', 'search_url')
 
     def __init__(self, instance_url: Optional[str] = None, api_key: Optional[str] = None, config: Optional[SearXNGConfig] = None):
         if instance_url:
@@ -170,11 +244,17 @@ class SearXNGAPI(SearchAPI):
         if self.config.api_key:
             self.headers['X-API-Key'] = self.config.api_key
 
+        # Ensure the instance URL ends with /search
+        self.search_url = self.config.instance_url
+        if not self.search_url.endswith('/search'):
+            self.search_url = self.search_url.rstrip('/') + '/search'
+
     def get_sources(
         self,
         query: str,
         num_results: int = 8,
-        stored_location: Optional[str] = None
+        stored_location: Optional[str] = None,
+        sections: AbstractSet[str] = ALL_SECTIONS
     ) -> SearchResult[Dict[str, Any]]:
         """
         Fetch search results from SearXNG instance.
@@ -183,6 +263,7 @@ class SearXNGAPI(SearchAPI):
             query: Search query string
             num_results: Number of results to return (default: 8)
             stored_location: Optional location string (may not be supported by all instances)
+            sections: Response sections to build (default: all)
 
         Returns:
             SearchResult containing the search results or error information
@@ -191,74 +272,82 @@ class SearXNGAPI(SearchAPI):
             return SearchResult(error="Query cannot be empty")
 
         try:
-            # Ensure the instance URL ends with /search
-            search_url = self.config.instance_url
-            if not search_url.endswith('/search'):
-                search_url = search_url.rstrip('/') + '/search'
-
-            # Prepare parameters for SearXNG
-            params = {
-                'q': query,
-                'format': 'json',
-                'pageno': 1,
-                'categories': 'general',
-                'language': 'all',
-                'time_range': None,
-                'safesearch': 0,
-                'engines': 'google,bing,duckduckgo',  # Default engines, can be customised
-                'max_results': min(max(1, num_results), 20)  # Limit to reasonable range
-            }
-
-            # Add location if provided and supported
-            if stored_location and stored_location != 'all':
-                params['language'] = stored_location
-
-            response = requests.get(
-                search_url,
+            response = _SESSION.get(
+                self.search_url,
                 headers=self.headers,
-                params=params,
+                params=self._build_params(query, num_results, stored_location),
                 timeout=self.config.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response.content)
+
+            return SearchResult(data=self._format_results(data, num_results, sections))
+
+        except requests.RequestException as e:
+            return SearchResult(error=f"SearXNG API request failed: {str(e)}")
+        except Exception as e:
+            return SearchResult(error=f"Unexpected error with SearXNG: {str(e)}")
 
-            # Transform SearXNG results to match SerperAPI format
+    @staticmethod
+    def _build_params(query: str, num_results: int, stored_location: Optional[str]) -> Dict[str, Any]:
+        """Build the SearXNG query parameters"""
+        params = {
+            'q': query,
+            'format': 'json',
+            'pageno': 1,
+            'categories': 'general',
+            'language': 'all',
+            'safesearch': 0,
+            'engines': 'google,bing,duckduckgo',  # Default engines, can be customised
+            'max_results': min(max(1, num_results), 20)  # Limit to reasonable range
+        }
+
+        # Add location if provided and supported
+        if stored_location and stored_location != 'all':
+            params['language'] = stored_location
+
+        return params
+
+    @staticmethod
+    def _format_results(data: Any, num_results: int, sections: AbstractSet[str]) -> Dict[str, Any]:
+        """Transform SearXNG results to match SerperAPI format"""
+        results = {}
+
+        if 'organic' in sections:
             organic_results = []
-            for result in data.get('results', [])[:num_results]:
+            for result in islice(data.get('results') or (), num_results):
                 organic_results.append({
                     'title': result.get('title', ''),
                     'link': result.get('url', ''),
                     'snippet': result.get('content', ''),
                     'date': result.get('publishedDate', '')
                 })
+            results['organic'] = organic_results
 
-            # Extract image results if available
+        # Extract image results if available, limited to 6 like SerperAPI
+        if 'images' in sections:
             image_results = []
-            for result in data.get('results', []):
-                if result.get('img_src'):
+            for result in data.get('results') or ():
+                if len(image_results) == 6:
+                    break
+                if image_url := result.get('img_src'):
                     image_results.append({
                         'title': result.get('title', ''),
-                        'imageUrl': result.get('img_src', '')
+                        'imageUrl': image_url
                     })
-            image_results = image_results[:6]  # Limit to 6 images like SerperAPI
+            results['images'] = image_results
 
-            # Format results to match SerperAPI structure
-            results = {
-                'organic': organic_results,
-                'images': image_results,
-                'topStories': [],  # SearXNG might not have direct equivalent
-                'graph': None,     # SearXNG doesn't provide knowledge graph
-                'answerBox': None, # SearXNG doesn't provide answer box
-                'peopleAlsoAsk': None,
-                'relatedSearches': data.get('suggestions', [])
-            }
+        # SearXNG has no direct equivalent for these sections
+        if 'topStories' in sections:
+            results['topStories'] = []
+        for section in _SEARXNG_NULL_SECTIONS:
+            if section in sections:
+                results[section] = None
 
-            return SearchResult(data=results)
+        if 'relatedSearches' in sections:
+            results['relatedSearches'] = _detach(data.get('suggestions') or [])
 
-        except requests.RequestException as e:
-            return SearchResult(error=f"SearXNG API request failed: {str(e)}")
-        except Exception as e:
-            return SearchResult(error=f"Unexpected error with SearXNG: {str(e)}")
+        return results
 
 
 def create_search_api(